@@ -5,167 +5,124 @@ YouTube Video Summarizer Web Application
 A Flask web app that allows users to input YouTube URLs and get AI-generated summaries.
 """
 
-from flask import Flask, render_template, request, jsonify
-import sys
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import os
-import re
-from urllib.parse import urlparse, parse_qs
+import json
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables from .env file (for local development)
 # In production, environment variables are set directly by the platform
 load_dotenv()  # Only loads if .env file exists, won't override production env vars
 
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-except ImportError:
-    print("Error: youtube-transcript-api package not installed.")
-    print("Please install it using: pip install youtube-transcript-api")
-    sys.exit(1)
+from yt_core import (
+    preload_dependencies,
+    extract_video_id,
+    get_youtube_transcript,
+    summarize_transcript,
+    stream_summary,
+    cache_get,
+    cache_set,
+    summary_cache_key,
+    SUMMARY_CACHE_TTL,
+    TRANSCRIPT_CACHE_TTL,
+)
 
-try:
-    from openai import OpenAI
-except ImportError:
-    print("Error: openai package not installed.")
-    print("Please install it using: pip install openai")
-    sys.exit(1)
+# Import transcript and OpenAI dependencies now, so a missing package stops the server at startup
+preload_dependencies()
 
 # Initialize Flask app
 app = Flask(__name__)
 
-# OpenAI API key - loaded from .env file
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+# Optional Celery task queue - enabled when a broker URL is configured
+summarize_task = None
+if os.getenv('CELERY_BROKER_URL'):
+    try:
+        from celery_app import summarize_task
+    except ImportError:
+        print("Warning: celery package not installed, summaries will run inline.")
+        print("Install it using: pip install 'celery[redis]'")
+
+# OpenAI API key - loaded from .env file, validated when the first summary is requested
+if not os.getenv('OPENAI_API_KEY'):
+    print("Warning: OPENAI_API_KEY not found in environment variables.")
+    print("Summaries will fail until it is set (e.g. in a .env file).")
+
+# /batch accepts several URLs and processes them concurrently
+MAX_BATCH_URLS = 20
+BATCH_MAX_WORKERS = 8
 
-if not OPENAI_API_KEY:
-    print("Error: OPENAI_API_KEY not found in environment variables.")
-    print("Please create a .env file with your OpenAI API key.")
-    sys.exit(1)
+
+def load_transcript(video_id):
+    """Return (transcript, error), reusing a cached transcript when available."""
+    transcript = cache_get(f"tr:{video_id}")
+    if transcript is None:
+        transcript, error = get_youtube_transcript(video_id)
+        if error:
+            return None, f'Failed to get transcript: {error}'
+        
+        if not transcript:
+            return None, 'No transcript found for this video'
+        
+        cache_set(f"tr:{video_id}", transcript, TRANSCRIPT_CACHE_TTL)
+    
+    return transcript, None
 
 
-def extract_video_id(youtube_url):
-    """Extract video ID from various YouTube URL formats."""
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-        r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-    ]
+def process_video(video_id, summary_style="structured"):
+    """Fetch the transcript and summarize it, returning the response payload."""
+    # Extract transcript
+    transcript, error = load_transcript(video_id)
+    if error:
+        return None, error
     
-    for pattern in patterns:
-        match = re.search(pattern, youtube_url)
-        if match:
-            return match.group(1)
+    # Generate summary
+    summary, error = summarize_transcript(transcript, summary_style)
+    if error:
+        return None, f'Failed to generate summary: {error}'
     
-    try:
-        parsed_url = urlparse(youtube_url)
-        if 'youtube.com' in parsed_url.netloc:
-            query_params = parse_qs(parsed_url.query)
-            if 'v' in query_params:
-                return query_params['v'][0]
-    except:
-        pass
+    if not summary:
+        return None, 'Failed to generate summary'
     
-    return None
+    result = {
+        'success': True,
+        'summary': summary,
+        'video_id': video_id,
+        'transcript_length': len(transcript),
+        'style': summary_style
+    }
+    cache_set(summary_cache_key(video_id, summary_style), json.dumps(result), SUMMARY_CACHE_TTL)
+    
+    return result, None
 
 
-def get_youtube_transcript(youtube_url, language_codes=['en']):
-    """Get the transcript of a YouTube video."""
+def summarize_url(youtube_url, summary_style="structured"):
+    """Summarize a single URL for /batch, returning its payload or an error entry."""
+    # Errors stay in this URL's entry so one failure doesn't take down the whole batch
     try:
         video_id = extract_video_id(youtube_url)
         if not video_id:
-            return None, "Could not extract video ID from URL"
-        
-        ytt_api = YouTubeTranscriptApi()
-        
-        try:
-            transcript_data = ytt_api.fetch(video_id, languages=language_codes)
-            transcript_list = transcript_data.to_raw_data()
-        except Exception as e:
-            try:
-                available_transcripts = ytt_api.list(video_id)
-                transcript_data = None
-                for transcript_obj in available_transcripts:
-                    try:
-                        transcript_data = transcript_obj.fetch()
-                        break
-                    except:
-                        continue
-                
-                if not transcript_data:
-                    return None, "No transcripts available for this video"
-                    
-                transcript_list = transcript_data.to_raw_data()
-            except Exception as e2:
-                error_msg = str(e2)
-                if "YouTube is blocking requests" in error_msg or "IP" in error_msg:
-                    return None, "YouTube is blocking requests from this server. This is common on cloud platforms. Try a different video or run the app locally."
-                return None, f"Error listing transcripts: {error_msg}"
-        
-        # Convert transcript list to formatted text
-        transcript_text = ""
-        for entry in transcript_list:
-            transcript_text += entry['text'] + " "
-        
-        return transcript_text.strip(), None
-        
-    except Exception as e:
-        return None, f"Error fetching transcript: {str(e)}"
-
-
-def summarize_transcript(transcript_text, summary_style="structured"):
-    """Generate a summary using OpenAI."""
-    try:
-        client = OpenAI(api_key=OPENAI_API_KEY)
+            return {'url': youtube_url, 'error': 'Failed to get transcript: Could not extract video ID from URL'}
         
-        if summary_style == "brief":
-            prompt = f"""Create a concise summary (1-2 paragraphs) of what happens in this video. Focus on the main content, who is involved, and what topics are discussed. Write in a straightforward, informative style.
-
-Transcript: {transcript_text}
-
-Brief Summary:"""
-            
-        elif summary_style == "detailed":
-            prompt = f"""Create a comprehensive summary that covers all important aspects of this video's content. Include specific details about conversations, topics discussed, people involved, and key information shared. Be thorough but factual - focus on what actually happens and what is said rather than promotional language.
-
-Transcript: {transcript_text}
-
-Detailed Summary:"""
-            
-        else:  # structured (default)
-            prompt = f"""Create a well-structured summary of this video's content. Organize the information clearly and focus on what actually happens in the video.
-
-Structure your summary with these sections:
-
-**Content Overview**: What type of video this is and who is involved
-**Main Topics Discussed**: The key subjects and conversations that take place
-**Key People**: Who appears in the video and their relevance
-**Important Information**: Specific details, announcements, or notable moments
-**Key Points**: The main takeaways from the content
-
-Write in a clear, factual tone. Focus on summarizing the actual content rather than using promotional language. Be specific about what is discussed and what information is shared.
-
-Transcript: {transcript_text}
-
-Content Summary:"""
+        cached = cache_get(summary_cache_key(video_id, summary_style))
+        if cached:
+            return {'url': youtube_url, **json.loads(cached), 'cache': 'HIT'}
         
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are an expert content analyst who creates clear, factual summaries of video content. Your summaries are informative, well-organized, and focus on what actually happens in the video. You write in a straightforward, professional tone that clearly explains the content without promotional language."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1500,
-            temperature=0.3
-        )
+        result, error = process_video(video_id, summary_style)
+        if error:
+            return {'url': youtube_url, 'error': error}
         
-        return response.choices[0].message.content.strip(), None
+        return {'url': youtube_url, **result, 'cache': 'MISS'}
         
     except Exception as e:
-        return None, f"Error generating summary: {str(e)}"
+        return {'url': youtube_url, 'error': f'An unexpected error occurred: {str(e)}'}
 
 
 @app.route('/')
 def index():
     """Serve the main page."""
-    return render_template('index.html')
+    # Stream summaries straight to the page unless a task queue handles them
+    return render_template('index.html', streaming=summarize_task is None)
 
 
 @app.route('/summarize', methods=['POST'])
@@ -179,36 +136,156 @@ def summarize():
         if not youtube_url:
             return jsonify({'error': 'Please provide a YouTube URL'})
         
-        # Extract transcript
-        transcript, error = get_youtube_transcript(youtube_url)
-        if error:
-            return jsonify({'error': f'Failed to get transcript: {error}'})
+        # Resolve the video ID once and pass it through the whole pipeline
+        video_id = extract_video_id(youtube_url)
+        if not video_id:
+            return jsonify({'error': 'Failed to get transcript: Could not extract video ID from URL'})
         
-        if not transcript:
-            return jsonify({'error': 'No transcript found for this video'})
+        # Serve repeat requests for the same video and style from the cache
+        cached = cache_get(summary_cache_key(video_id, summary_style))
+        if cached:
+            response = jsonify({**json.loads(cached), 'cache': 'HIT'})
+            response.headers['X-Cache'] = 'HIT'
+            return response
         
-        # Generate summary
-        summary, error = summarize_transcript(transcript, summary_style)
-        if error:
-            return jsonify({'error': f'Failed to generate summary: {error}'})
+        # Hand the work to a Celery worker when the task queue is configured
+        if summarize_task is not None:
+            task = summarize_task.delay(video_id, summary_style)
+            response = jsonify({'task_id': task.id})
+        else:
+            result, error = process_video(video_id, summary_style)
+            if error:
+                return jsonify({'error': error})
+            response = jsonify({**result, 'cache': 'MISS'})
         
-        if not summary:
-            return jsonify({'error': 'Failed to generate summary'})
+        response.headers['X-Cache'] = 'MISS'
+        return response
         
-        video_id = extract_video_id(youtube_url)
+    except Exception as e:
+        return jsonify({'error': f'An unexpected error occurred: {str(e)}'})
+
+
+@app.route('/batch', methods=['POST'])
+def batch():
+    """Summarize several YouTube URLs concurrently."""
+    try:
+        data = request.get_json()
+        urls = data.get('urls', [])
+        summary_style = data.get('style', 'structured')
+        
+        if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+            return jsonify({'error': 'Please provide the YouTube URLs as a list of strings'})
+        
+        urls = [url.strip() for url in urls if url.strip()]
+        if not urls:
+            return jsonify({'error': 'Please provide at least one YouTube URL'})
+        
+        if len(urls) > MAX_BATCH_URLS:
+            return jsonify({'error': f'Please provide at most {MAX_BATCH_URLS} YouTube URLs'})
+        
+        # Transcript fetches and OpenAI calls are I/O-bound, so threads overlap their waits
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as pool:
+            results = list(pool.map(lambda url: summarize_url(url, summary_style), urls))
+        
+        return jsonify({'success': True, 'results': results})
+        
+    except Exception as e:
+        return jsonify({'error': f'An unexpected error occurred: {str(e)}'})
+
+
+def sse_event(event, data):
+    """Format a Server-Sent Events message with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/summarize/stream')
+def summarize_stream():
+    """Stream a summary to the browser as Server-Sent Events while it is generated."""
+    youtube_url = request.args.get('url', '').strip()
+    summary_style = request.args.get('style', 'structured')
+    
+    def generate():
+        try:
+            if not youtube_url:
+                yield sse_event('error', {'error': 'Please provide a YouTube URL'})
+                return
+            
+            video_id = extract_video_id(youtube_url)
+            if not video_id:
+                yield sse_event('error', {'error': 'Failed to get transcript: Could not extract video ID from URL'})
+                return
+            
+            cached = cache_get(summary_cache_key(video_id, summary_style))
+            if cached:
+                yield sse_event('done', {**json.loads(cached), 'cache': 'HIT'})
+                return
+            
+            transcript, error = load_transcript(video_id)
+            if error:
+                yield sse_event('error', {'error': error})
+                return
+            
+            yield sse_event('meta', {
+                'video_id': video_id,
+                'transcript_length': len(transcript),
+                'style': summary_style
+            })
+            
+            parts = []
+            try:
+                for delta in stream_summary(transcript, summary_style):
+                    parts.append(delta)
+                    yield sse_event('delta', {'text': delta})
+            except Exception as e:
+                yield sse_event('error', {'error': f'Failed to generate summary: {str(e)}'})
+                return
+            
+            summary = "".join(parts).strip()
+            if not summary:
+                yield sse_event('error', {'error': 'Failed to generate summary'})
+                return
+            
+            result = {
+                'success': True,
+                'summary': summary,
+                'video_id': video_id,
+                'transcript_length': len(transcript),
+                'style': summary_style
+            }
+            cache_set(summary_cache_key(video_id, summary_style), json.dumps(result), SUMMARY_CACHE_TTL)
+            yield sse_event('done', {**result, 'cache': 'MISS'})
+            
+        except Exception as e:
+            yield sse_event('error', {'error': f'An unexpected error occurred: {str(e)}'})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/status/<task_id>')
+def status(task_id):
+    """Report the state of a queued summarization task."""
+    if summarize_task is None:
+        return jsonify({'error': 'Background processing is not enabled'})
+    
+    try:
+        result = summarize_task.AsyncResult(task_id)
+        if not result.ready():
+            return jsonify({'status': result.state.lower()})
+        
+        if result.failed():
+            return jsonify({'error': f'An unexpected error occurred: {str(result.result)}'})
         
-        return jsonify({
-            'success': True,
-            'summary': summary,
-            'video_id': video_id,
-            'transcript_length': len(transcript),
-            'style': summary_style
-        })
+        return jsonify(result.result)
         
     except Exception as e:
         return jsonify({'error': f'An unexpected error occurred: {str(e)}'})
 
 
+# Development server only - production runs under gunicorn: gunicorn app:app -c gunicorn.conf.py
 if __name__ == '__main__':
     # Create templates and static directories if they don't exist
     os.makedirs('templates', exist_ok=True)
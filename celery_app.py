@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+YouTube Video Summarizer Task Queue
+
+Celery application that runs transcript extraction and summarization outside
+the web request, so the Flask workers only enqueue jobs and answer status polls.
+
+Start a worker with:
+    celery -A celery_app worker -c 8
+"""
+
+import os
+from celery import Celery
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Broker and result backend - Redis by default, overridable per environment
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+
+celery_app = Celery("yt", broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+celery_app.conf.update(
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    result_expires=3600,
+)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def summarize_task(self, video_id, summary_style="structured"):
+    """Fetch the transcript for a video ID and summarize it, returning the /summarize payload."""
+    # Imported here because app.py imports this module when the queue is enabled
+    from app import process_video
+
+    try:
+        result, error = process_video(video_id, summary_style)
+    except Exception as e:
+        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+
+    if error:
+        return {'error': error}
+
+    return result
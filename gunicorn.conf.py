@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the YouTube Video Summarizer
+
+Requests spend most of their time waiting on YouTube and OpenAI, so each worker
+runs many threads (gthread) instead of gunicorn's default one-request sync worker.
+
+Production launch command:
+    gunicorn app:app -c gunicorn.conf.py
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gthread"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+
+# Long transcripts can take a couple of minutes to summarize
+timeout = 120
@@ -3,14 +3,15 @@
 YouTube Video Summarizer
 
 This script extracts transcripts from YouTube videos and generates content summaries using OpenAI.
-It uses the youtube-transcript-api library to fetch transcripts and OpenAI's API for summarization.
+Transcript fetching and summarization are shared with the web app in yt_core.py.
 """
 
 import sys
 import os
+import asyncio
 import re
 import argparse
-from urllib.parse import urlparse, parse_qs
+import hashlib
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -19,19 +20,8 @@ if 'OPENAI_API_KEY' in os.environ:
     del os.environ['OPENAI_API_KEY']
 load_dotenv(override=True)
 
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-except ImportError:
-    print("Error: youtube-transcript-api package not installed.")
-    print("Please install it using: pip install youtube-transcript-api")
-    sys.exit(1)
-
-try:
-    from openai import OpenAI
-except ImportError:
-    print("Error: openai package not installed.")
-    print("Please install it using: pip install openai")
-    sys.exit(1)
+import yt_core
+from yt_core import extract_video_id
 
 # OpenAI API key - loaded from .env file
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
@@ -41,103 +31,75 @@ if not OPENAI_API_KEY:
     print("Please create a .env file with your OpenAI API key.")
     sys.exit(1)
 
-
-def extract_video_id(youtube_url):
-    """
-    Extract video ID from various YouTube URL formats.
-    
-    Supports:
-    - https://www.youtube.com/watch?v=VIDEO_ID
-    - https://youtu.be/VIDEO_ID
-    - https://www.youtube.com/embed/VIDEO_ID
-    - https://m.youtube.com/watch?v=VIDEO_ID
-    """
-    # Regular expression patterns for different YouTube URL formats
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-        r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, youtube_url)
-        if match:
-            return match.group(1)
-    
-    # Try parsing as URL query parameter
-    try:
-        parsed_url = urlparse(youtube_url)
-        if 'youtube.com' in parsed_url.netloc:
-            query_params = parse_qs(parsed_url.query)
-            if 'v' in query_params:
-                return query_params['v'][0]
-    except:
-        pass
-    
-    return None
+# simple_summarize scans the transcript once for intro phrases, known names and topic
+# keywords, then checks for each context cue phrase
+_INTRO_PHRASES = ("this is about", "we're talking about", "today", "the biggest", "announcement")
+_TOPIC_KEYWORDS = {
+    'bitcoin': ('bitcoin', 'cryptocurrency', 'money'),
+    'married': ('married', 'children', 'bachelor', 'family'),
+    'drink': ('drink', 'sober', 'alcohol'),
+    'years': ('years', 'year', 'time', 'ago'),
+    'miss': ('missed', 'miss', 'away'),
+    'show': ('show', 'fans', 'people'),
+}
+_TOPIC_BY_KEYWORD = {keyword: topic for topic, keywords in _TOPIC_KEYWORDS.items() for keyword in keywords}
+_CONTEXT_CUES = (
+    ('five years', "There's discussion about a five-year absence or gap. "),
+    ('hotel', "The conversation appears to take place in a hotel setting. "),
+    ('announce', "Some kind of announcement or news is being shared. "),
+)
+_SUMMARY_SCANNER = re.compile(
+    # Intro text is captured in a lookahead so names and topics inside it are still seen;
+    # it stops at the sentence end and the possessive {20,100}+ never backtracks
+    r"(?P<intro>" + "|".join(re.escape(phrase) for phrase in _INTRO_PHRASES) + r") (?=(?P<intro_text>[^.!?\n]{20,100}+))"
+    r"|\b(?P<person>beetlejuice|robin|eric|bobby|howard|sal)\b"
+    r"|(?P<topic>" + "|".join(_TOPIC_BY_KEYWORD) + r")"
+)
 
 
-def get_youtube_transcript(youtube_url, language_codes=['en']):
+def get_youtube_transcript(youtube_url, language_codes=['en'], use_cache=True):
     """
     Get the transcript of a YouTube video.
     
     Args:
         youtube_url (str): The YouTube video URL
         language_codes (list): Preferred language codes for transcript
+        use_cache (bool): Whether to reuse and store cached transcripts
         
     Returns:
-        str: The transcript text, or None if not available
+        tuple: (video_id, transcript_text), with None for a value that is not available
     """
-    try:
-        # Extract video ID from URL
-        video_id = extract_video_id(youtube_url)
-        if not video_id:
-            print(f"Error: Could not extract video ID from URL: {youtube_url}")
-            return None
-        
-        print(f"Extracting transcript for video ID: {video_id}")
-        
-        # Initialize the API client
-        ytt_api = YouTubeTranscriptApi()
-        
-        # Try to get transcript in preferred languages
-        try:
-            transcript_data = ytt_api.fetch(video_id, languages=language_codes)
-            transcript_list = transcript_data.to_raw_data()
-        except Exception as e:
-            # If preferred languages fail, try to get any available transcript
-            print(f"Preferred languages not available, trying any available transcript...")
-            try:
-                available_transcripts = ytt_api.list(video_id)
-                
-                # Try to find any transcript (auto-generated or manual)
-                transcript_data = None
-                for transcript_obj in available_transcripts:
-                    try:
-                        transcript_data = transcript_obj.fetch()
-                        print(f"Found transcript in language: {transcript_obj.language}")
-                        break
-                    except:
-                        continue
-                
-                if not transcript_data:
-                    print("Error: No transcripts available for this video")
-                    return None
-                    
-                transcript_list = transcript_data.to_raw_data()
-            except Exception as e2:
-                print(f"Error listing transcripts: {str(e2)}")
-                return None
-        
-        # Convert transcript list to formatted text
-        transcript_text = ""
-        for entry in transcript_list:
-            transcript_text += entry['text'] + " "
-        
-        return transcript_text.strip()
-        
-    except Exception as e:
-        print(f"Error fetching transcript: {str(e)}")
-        return None
+    # Extract video ID from URL
+    video_id = extract_video_id(youtube_url)
+    if not video_id:
+        print(f"Error: Could not extract video ID from URL: {youtube_url}")
+        return None, None
+    
+    cache_key = f"tr:{video_id}"
+    if use_cache:
+        transcript_text = yt_core.cache_get(cache_key)
+        if transcript_text:
+            print(f"Using cached transcript for video ID: {video_id}")
+            return video_id, transcript_text
+    
+    print(f"Extracting transcript for video ID: {video_id}")
+    
+    transcript_text, error = yt_core.get_youtube_transcript(video_id, language_codes)
+    if error:
+        print(f"Error: {error}")
+        return video_id, None
+    
+    if use_cache and transcript_text:
+        yt_core.cache_set(cache_key, transcript_text, yt_core.TRANSCRIPT_CACHE_TTL)
+    
+    return video_id, transcript_text
+
+
+def transcript_summary_key(video_id, summary_style, transcript_text, model=None):
+    """Build the cache key for a summary of this exact transcript, style and model."""
+    model = yt_core.summary_model(transcript_text, summary_style, model)
+    digest = hashlib.sha1(transcript_text.encode('utf-8')).hexdigest()
+    return f"sum:{video_id}:{summary_style}:{model}:{digest}"
 
 
 def simple_summarize(transcript_text):
@@ -150,100 +112,62 @@ def simple_summarize(transcript_text):
     Returns:
         str: An actual summary of the video content
     """
-    import re
-    from collections import Counter
-    
-    # Clean up the text
+    # Scanning a lowercased copy case-sensitively is much faster than re.IGNORECASE
     text = transcript_text.lower()
+    # Intro text is sliced from the original to keep its case, unless lowercasing
+    # changed the length (a few non-ASCII characters) and the offsets no longer line up
+    source = transcript_text if len(text) == len(transcript_text) else text
     
-    # Remove common filler words and clean text
-    filler_words = {'um', 'uh', 'like', 'you know', 'so', 'well', 'yeah', 'oh', 'okay', 'right', 'i mean', 'blah'}
-    
-    # Extract key information patterns
-    summary_parts = []
-    
-    # Look for introductory phrases that indicate main topics
-    intro_patterns = [
-        r"this is about (.{20,100})",
-        r"we're talking about (.{20,100})",
-        r"today (.{20,100})",
-        r"the biggest (.{20,100})",
-        r"announcement (.{20,100})"
-    ]
-    
-    for pattern in intro_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            summary_parts.extend(matches[:2])  # Take first 2 matches
-    
-    # Look for people mentioned (capitalize common names)
+    # One pass collects intro phrases (first 2 of each), people and topics
+    intro_matches = {phrase: [] for phrase in _INTRO_PHRASES}
     people_mentioned = []
-    name_patterns = [
-        r"\b(beetlejuice|robin|eric|bobby|howard|sal)\b"
-    ]
-    
-    for pattern in name_patterns:
-        matches = re.findall(pattern, text)
-        people_mentioned.extend(matches)
-    
-    # Get most frequent meaningful words (excluding common words)
-    words = re.findall(r'\b[a-zA-Z]{4,}\b', text)
-    common_words = {'this', 'that', 'with', 'have', 'they', 'will', 'been', 'said', 'each', 'which', 'their', 'time', 'were', 'there', 'what', 'your', 'when', 'them'}
-    meaningful_words = [w for w in words if w not in common_words and w not in filler_words]
-    word_freq = Counter(meaningful_words)
-    top_words = [word for word, count in word_freq.most_common(10) if count > 2]
-    
-    # Look for specific topics/activities mentioned
-    topics = []
-    topic_patterns = [
-        r"(bitcoin|cryptocurrency|money)",
-        r"(married|children|bachelor|family)",
-        r"(drink|sober|alcohol)",
-        r"(years?|time|ago)",
-        r"(miss|missed|away)",
-        r"(show|fans|people)"
-    ]
-    
-    for pattern in topic_patterns:
-        if re.search(pattern, text):
-            topics.append(pattern.strip('()').split('|')[0])
+    found_topics = set()
+    for match in _SUMMARY_SCANNER.finditer(text):
+        kind = match.lastgroup
+        if kind == 'intro_text':
+            matches = intro_matches[match.group('intro')]
+            if len(matches) < 2:
+                matches.append(source[match.start('intro_text'):match.end('intro_text')])
+        elif kind == 'person':
+            people_mentioned.append(match.group('person'))
+        else:
+            found_topics.add(_TOPIC_BY_KEYWORD[match.group('topic')])
+    
+    summary_parts = [part for phrase in _INTRO_PHRASES for part in intro_matches[phrase]]
+    topics = [topic for topic in _TOPIC_KEYWORDS if topic in found_topics]
     
     # Create actual summary
-    summary = "Video Summary:\n\n"
+    summary = ["Video Summary:\n\n"]
     
     # Determine main subject
-    if 'beetlejuice' in text:
-        summary += "This appears to be an interview or conversation with Beetlejuice, a personality from a radio show. "
+    if 'beetlejuice' in people_mentioned:
+        summary.append("This appears to be an interview or conversation with Beetlejuice, a personality from a radio show. ")
     
     # Add main topics
     if topics:
-        summary += f"The discussion covers topics including: {', '.join(topics[:5])}. "
+        summary.append(f"The discussion covers topics including: {', '.join(topics[:5])}. ")
     
     # Add key people
     if people_mentioned:
         unique_people = list(set(people_mentioned))
-        summary += f"Key people mentioned: {', '.join(unique_people[:5])}. "
+        summary.append(f"Key people mentioned: {', '.join(unique_people[:5])}. ")
     
     # Add context from patterns found
     if summary_parts:
         cleaned_parts = [part.strip(' .') for part in summary_parts[:2]]
-        summary += f"Main points discussed: {' '.join(cleaned_parts)}. "
+        summary.append(f"Main points discussed: {' '.join(cleaned_parts)}. ")
     
-    # Look for time references and context
-    if 'five years' in text:
-        summary += "There's discussion about a five-year absence or gap. "
-    if 'hotel' in text:
-        summary += "The conversation appears to take place in a hotel setting. "
-    if 'announce' in text:
-        summary += "Some kind of announcement or news is being shared. "
+    # Add time references and context; plain substring checks are faster than
+    # folding these into the scanner
+    summary.extend(sentence for phrase, sentence in _CONTEXT_CUES if phrase in text)
     
     # Add conclusion
-    summary += "\n\nThis appears to be a radio show or podcast interview format with casual conversation and discussion of personal topics."
+    summary.append("\n\nThis appears to be a radio show or podcast interview format with casual conversation and discussion of personal topics.")
     
-    return summary
+    return "".join(summary)
 
 
-def summarize_transcript(transcript_text, use_openai=True, summary_style="structured"):
+async def summarize_transcript_async(transcript_text, use_openai=True, summary_style="structured", cache_key=None, model=None):
     """
     Generate a summary of the transcript using OpenAI's API or simple method.
     
@@ -251,70 +175,209 @@ def summarize_transcript(transcript_text, use_openai=True, summary_style="struct
         transcript_text (str): The full transcript text to summarize
         use_openai (bool): Whether to try OpenAI first
         summary_style (str): Style of summary - "structured", "brief", or "detailed"
+        cache_key (str): Cache key for the OpenAI summary, or None to skip the cache
+        model (str): OpenAI model to use, or None to choose one automatically
         
     Returns:
         str: The generated summary, or None if there was an error
     """
     if use_openai:
-        try:
-            # Initialize OpenAI client
-            client = OpenAI(api_key=OPENAI_API_KEY)
-            
-            # Choose prompt based on summary style
-            if summary_style == "brief":
-                prompt = f"""Create a concise summary (1-2 paragraphs) of what happens in this video. Focus on the main content, who is involved, and what topics are discussed. Write in a straightforward, informative style.
+        if cache_key:
+            summary = yt_core.cache_get(cache_key)
+            if summary:
+                print("Using cached summary")
+                return summary
+        
+        print("Generating content summary using OpenAI...")
+        
+        summary, error = await yt_core.summarize_transcript_async(transcript_text, summary_style, model)
+        if error:
+            print(f"OpenAI error: {error}")
+            print("Falling back to simple summarization method...")
+            return simple_summarize(transcript_text)
+        
+        # Only OpenAI summaries are cached; the simple method is cheap to rerun
+        if cache_key and summary:
+            yt_core.cache_set(cache_key, summary)
+        
+        return summary
+    else:
+        print("Using simple summarization method...")
+        return simple_summarize(transcript_text)
 
-Transcript: {transcript_text}
 
-Brief Summary:"""
-                
-            elif summary_style == "detailed":
-                prompt = f"""Create a comprehensive summary that covers all important aspects of this video's content. Include specific details about conversations, topics discussed, people involved, and key information shared. Be thorough but factual - focus on what actually happens and what is said rather than promotional language.
+async def summarize_video(youtube_url, use_openai=True, summary_style="structured", use_cache=True, model=None):
+    """
+    Extract the transcript of one video and summarize it.
+    
+    Args:
+        youtube_url (str): The YouTube video URL
+        use_openai (bool): Whether to try OpenAI first
+        summary_style (str): Style of summary - "structured", "brief", or "detailed"
+        use_cache (bool): Whether to reuse and store cached transcripts and summaries
+        model (str): OpenAI model to use, or None to choose one automatically
+        
+    Returns:
+        tuple: (video_id, transcript, summary), with None for a step that failed
+    """
+    # The transcript API is blocking, so run it in a thread to overlap other videos
+    video_id, transcript = await asyncio.to_thread(get_youtube_transcript, youtube_url, use_cache=use_cache)
+    if not transcript:
+        return video_id, None, None
+    
+    print(f"✅ Transcript extracted successfully ({len(transcript)} characters)")
+    
+    cache_key = None
+    if use_cache:
+        cache_key = transcript_summary_key(video_id, summary_style, transcript, model)
+    summary = await summarize_transcript_async(transcript, use_openai, summary_style, cache_key, model)
+    return video_id, transcript, summary
 
-Transcript: {transcript_text}
 
-Detailed Summary:"""
-                
-            else:  # structured (default) - Content Summary Style
-                prompt = f"""Create a well-structured summary of this video's content. Organize the information clearly and focus on what actually happens in the video.
+async def summarize_videos(youtube_urls, use_openai=True, summary_style="structured", use_cache=True, model=None):
+    """Summarize several videos concurrently, returning (video_id, transcript, summary) per URL in order."""
+    videos = [summarize_video(url, use_openai, summary_style, use_cache, model) for url in youtube_urls]
+    if not use_openai:
+        return await asyncio.gather(*videos)
+    
+    # Complete the TLS handshake with OpenAI while transcripts download, so the first
+    # summary request goes out on a warm connection; results never wait for it
+    prewarm = asyncio.create_task(yt_core.prewarm_openai_async())
+    results = await asyncio.gather(*videos)
+    prewarm.cancel()
+    return results
 
-Structure your summary with these sections:
 
-**Content Overview**: What type of video this is and who is involved
-**Main Topics Discussed**: The key subjects and conversations that take place
-**Key People**: Who appears in the video and their relevance
-**Important Information**: Specific details, announcements, or notable moments
-**Key Points**: The main takeaways from the content
+async def stream_video_summary(youtube_url, summary_style="structured", use_cache=True, model=None):
+    """
+    Summarize one video with OpenAI, printing and saving the summary as it is generated.
+    
+    Args:
+        youtube_url (str): The YouTube video URL
+        summary_style (str): Style of summary - "structured", "brief", or "detailed"
+        use_cache (bool): Whether to reuse and store cached transcripts and summaries
+        model (str): OpenAI model to use, or None to choose one automatically
+        
+    Returns:
+        bool: True if a summary was produced
+    """
+    # Warm the OpenAI connection in the background while the transcript downloads
+    prewarm = asyncio.create_task(yt_core.prewarm_openai_async())
+    video_id, transcript = await asyncio.to_thread(get_youtube_transcript, youtube_url, use_cache=use_cache)
+    if not transcript:
+        prewarm.cancel()
+        return report_summary(youtube_url, video_id, None, None, summary_style)
+    
+    print(f"✅ Transcript extracted successfully ({len(transcript)} characters)")
+    
+    cache_key = transcript_summary_key(video_id, summary_style, transcript, model) if use_cache else None
+    cached = yt_core.cache_get(cache_key) if cache_key else None
+    if cached:
+        # No OpenAI request will follow, so stop warming the connection
+        prewarm.cancel()
+        print("Using cached summary")
+        return report_summary(youtube_url, video_id, transcript, cached, summary_style)
+    
+    print("Generating content summary using OpenAI...")
+    print(f"\n📝 Video Summary ({summary_style.title()} Style):")
+    print("=" * 50)
+    
+    # Tokens go to the terminal and the summary file as they arrive
+    summary_filename = f"summary_{video_id}_{summary_style}.txt"
+    try:
+        summary_file = open(summary_filename, 'w', encoding='utf-8')
+        summary_file.write(summary_header(youtube_url, video_id, summary_style))
+    except Exception as e:
+        print(f"❌ Could not save summary to file: {e}")
+        summary_file = None
+    
+    parts = []
+    try:
+        async for delta in yt_core.stream_summary_async(transcript, summary_style, model):
+            parts.append(delta)
+            sys.stdout.write(delta)
+            sys.stdout.flush()
+            if summary_file:
+                summary_file.write(delta)
+    except Exception as e:
+        print(f"\nOpenAI error: Error generating summary: {str(e)}")
+        print("Falling back to simple summarization method...")
+        if summary_file:
+            summary_file.close()
+            summary_file = None
+        return report_summary(youtube_url, video_id, transcript, simple_summarize(transcript), summary_style)
+    finally:
+        if summary_file:
+            summary_file.close()
+    
+    summary = "".join(parts).strip()
+    print()
+    print("=" * 50)
+    if not summary:
+        print(f"❌ Failed to generate summary for {youtube_url}")
+        return False
+    
+    if summary_file:
+        print(f"💾 Summary saved to: {summary_filename}")
+    if cache_key:
+        yt_core.cache_set(cache_key, summary)
+    
+    return True
 
-Write in a clear, factual tone. Focus on summarizing the actual content rather than using promotional language. Be specific about what is discussed and what information is shared.
 
-Transcript: {transcript_text}
+def summary_header(youtube_url, video_id, summary_style):
+    """Return the header that starts every saved summary file."""
+    return (
+        f"YouTube Video Summary ({summary_style.title()} Style)\n"
+        f"URL: {youtube_url}\n"
+        f"Video ID: {video_id}\n"
+        f"{'='*50}\n\n"
+    )
 
-Content Summary:"""
-            
-            print("Generating content summary using OpenAI...")
-            
-            # Make API call to OpenAI with improved settings
-            response = client.chat.completions.create(
-                model="gpt-4o",  # Upgraded to GPT-4 for highest quality
-                messages=[
-                    {"role": "system", "content": "You are an expert content analyst who creates clear, factual summaries of video content. Your summaries are informative, well-organized, and focus on what actually happens in the video. You write in a straightforward, professional tone that clearly explains the content without promotional language. You include specific details and quotes to give readers a complete understanding of what the video covers."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500,  # Increased for detailed YouTube-style descriptions
-                temperature=0.3
-            )
-            
-            summary = response.choices[0].message.content.strip()
-            return summary
-            
-        except Exception as e:
-            print(f"OpenAI error: {str(e)}")
-            print("Falling back to simple summarization method...")
-            return simple_summarize(transcript_text)
-    else:
-        print("Using simple summarization method...")
-        return simple_summarize(transcript_text)
+
+def report_summary(youtube_url, video_id, transcript, summary, summary_style, show_url=False):
+    """
+    Print a finished summary and save it to a file, or explain what failed.
+    
+    Args:
+        youtube_url (str): The YouTube video URL
+        video_id (str): The video ID extracted from the URL, or None if extraction failed
+        transcript (str): The transcript text, or None if extraction failed
+        summary (str): The summary text, or None if summarization failed
+        summary_style (str): Style of summary - "structured", "brief", or "detailed"
+        show_url (bool): Whether to label the summary with its URL
+        
+    Returns:
+        bool: True if a summary was produced
+    """
+    if not transcript:
+        print(f"❌ Failed to extract transcript for {youtube_url}. Please check:")
+        print("- The URL is correct and the video exists")
+        print("- The video has captions/transcripts available")
+        print("- The video is not private or restricted")
+        return False
+    
+    if not summary:
+        print(f"❌ Failed to generate summary for {youtube_url}")
+        return False
+    
+    print(f"\n📝 Video Summary ({summary_style.title()} Style):")
+    if show_url:
+        print(f"URL: {youtube_url}")
+    print("=" * 50)
+    print(summary)
+    print("=" * 50)
+    
+    # Save summary to file
+    summary_filename = f"summary_{video_id}_{summary_style}.txt"
+    try:
+        with open(summary_filename, 'w', encoding='utf-8') as f:
+            f.write(summary_header(youtube_url, video_id, summary_style) + summary)
+        print(f"💾 Summary saved to: {summary_filename}")
+    except Exception as e:
+        print(f"❌ Could not save summary to file: {e}")
+    
+    return True
 
 
 def main():
@@ -334,62 +397,57 @@ Examples:
   python youtube_transcript_summarizer.py "https://www.youtube.com/watch?v=VIDEO_ID"
   python youtube_transcript_summarizer.py "https://www.youtube.com/watch?v=VIDEO_ID" --style brief
   python youtube_transcript_summarizer.py "https://www.youtube.com/watch?v=VIDEO_ID" --style detailed --no-openai
+  python youtube_transcript_summarizer.py "https://youtu.be/VIDEO_ID_1" "https://youtu.be/VIDEO_ID_2"
         """
     )
     
-    parser.add_argument("url", help="YouTube video URL")
+    parser.add_argument("urls", nargs="+", metavar="url", help="YouTube video URL (several may be given)")
     parser.add_argument("--style", choices=["structured", "brief", "detailed"], 
                        default="structured", help="Summary style (default: structured)")
     parser.add_argument("--no-openai", action="store_true", 
                        help="Use simple summarizer instead of OpenAI")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Fetch and summarize again instead of using cached results")
+    parser.add_argument("--model", default=None,
+                       help="OpenAI model for the summary and any long-transcript sections "
+                            "(default: gpt-4o-mini, or gpt-4o for detailed summaries and long transcripts)")
     
     args = parser.parse_args()
     
+    # Repeat runs for the same video reuse the transcript and summary from disk
+    if not args.no_cache:
+        yt_core.open_disk_cache()
+    
     print("🎥 YouTube Video Summarizer")
     print("=" * 50)
-    print(f"URL: {args.url}")
+    for url in args.urls:
+        print(f"URL: {url}")
     print(f"Summary Style: {args.style}")
     print("-" * 50)
     
-    # Extract transcript
-    transcript = get_youtube_transcript(args.url)
+    use_openai = not args.no_openai
+    use_cache = not args.no_cache
     
-    if transcript:
-        print(f"✅ Transcript extracted successfully ({len(transcript)} characters)")
-        
-        # Generate summary using specified method and style
-        use_openai = not args.no_openai
-        summary = summarize_transcript(transcript, use_openai=use_openai, summary_style=args.style)
-        
-        if summary:
-            print(f"\n📝 Video Summary ({args.style.title()} Style):")
-            print("=" * 50)
-            print(summary)
-            print("=" * 50)
-            
-            # Save summary to file
-            video_id = extract_video_id(args.url)
-            summary_filename = f"summary_{video_id}_{args.style}.txt"
-            try:
-                with open(summary_filename, 'w', encoding='utf-8') as f:
-                    f.write(f"YouTube Video Summary ({args.style.title()} Style)\n")
-                    f.write(f"URL: {args.url}\n")
-                    f.write(f"Video ID: {video_id}\n")
-                    f.write(f"{'='*50}\n\n")
-                    f.write(summary)
-                print(f"💾 Summary saved to: {summary_filename}")
-            except Exception as e:
-                print(f"❌ Could not save summary to file: {e}")
-        else:
-            print("❌ Failed to generate summary")
+    # A single video streams its summary to the terminal and file as it is generated
+    if use_openai and len(args.urls) == 1:
+        if not asyncio.run(stream_video_summary(
+            args.urls[0], summary_style=args.style, use_cache=use_cache, model=args.model
+        )):
             sys.exit(1)
-    else:
-        print("❌ Failed to extract transcript. Please check:")
-        print("- The URL is correct and the video exists")
-        print("- The video has captions/transcripts available")
-        print("- The video is not private or restricted")
+        return
+    
+    # Extract transcripts and generate summaries for all videos at once
+    results = asyncio.run(summarize_videos(
+        args.urls, use_openai=use_openai, summary_style=args.style, use_cache=use_cache, model=args.model
+    ))
+    
+    failed = False
+    for url, (video_id, transcript, summary) in zip(args.urls, results):
+        if not report_summary(url, video_id, transcript, summary, args.style, show_url=len(args.urls) > 1):
+            failed = True
+    
+    if failed:
         sys.exit(1)
 
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""
+YouTube Video Summarizer Core
+
+Shared transcript extraction and OpenAI summarization used by both the web app
+(app.py) and the command-line tool (youtube_transcript_summarizer.py).
+Entry points load their .env before importing this module.
+"""
+
+import sys
+import os
+import asyncio
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from urllib.parse import urlsplit, parse_qs
+
+# Cache for transcripts and summaries: Redis when REDIS_URL is set (shared by every
+# process), otherwise an on-disk cache that the CLI opens with open_disk_cache()
+REDIS_URL = os.getenv('REDIS_URL')
+DISK_CACHE_DIR = os.getenv('CACHE_DIR', '.cache')
+SUMMARY_CACHE_TTL = 7 * 24 * 3600
+TRANSCRIPT_CACHE_TTL = 24 * 3600
+_redis = None
+_disk_cache = None
+if REDIS_URL:
+    try:
+        import redis
+        _redis = redis.Redis.from_url(REDIS_URL)
+    except ImportError:
+        print("Warning: redis package not installed, caching is disabled.")
+        print("Install it using: pip install redis")
+
+# Cached values are compressed: zstd level 3 when zstandard is installed, zlib otherwise.
+# zstd frames start with a fixed magic number, so entries in either format stay readable
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# In-process semantic cache: reuse summaries of near-identical transcripts (reposts, mirrors)
+SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE', 'true').lower() != 'false'
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.95'))
+SEMANTIC_CACHE_SIZE = 1000
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_INPUT_CHARS = 4000
+_semantic_index = {}  # style -> (unit embedding matrix, summaries)
+_semantic_lock = threading.Lock()
+
+# Shared OpenAI clients so every summary reuses pooled keep-alive connections; idle
+# sockets stay open for a minute and an unreachable API fails fast on connect
+OPENAI_HTTP_LIMITS = {"max_connections": 100, "max_keepalive_connections": 20, "keepalive_expiry": 60}
+OPENAI_TIMEOUT = 60.0
+OPENAI_CONNECT_TIMEOUT = 5.0
+_openai_client = None
+_async_openai_client = None
+_openai_client_lock = threading.Lock()
+
+# YouTube requests reuse a pooled session per thread (the transcript API is not
+# thread-safe) and time out instead of hanging; dropped connections and timeouts
+# are retried with exponential backoff before falling back to listing transcripts
+TRANSCRIPT_HTTP_POOL_SIZE = 20
+TRANSCRIPT_FETCH_ATTEMPTS = 3
+TRANSCRIPT_CONNECT_TIMEOUT = 5.0
+TRANSCRIPT_READ_TIMEOUT = 20.0
+_transcript_clients = threading.local()
+
+
+# Heavy dependencies are imported on first use, so the CLI starts quickly and URL
+# parsing never pays for the OpenAI SDK or the transcript API
+@lru_cache(maxsize=1)
+def _import_transcript_api():
+    """Return the youtube_transcript_api module, imported on first use."""
+    try:
+        import youtube_transcript_api
+    except ImportError:
+        print("Error: youtube-transcript-api package not installed.")
+        print("Please install it using: pip install youtube-transcript-api")
+        sys.exit(1)
+    return youtube_transcript_api
+
+
+@lru_cache(maxsize=1)
+def _import_openai():
+    """Return the (httpx, openai) modules, imported on first use."""
+    try:
+        import httpx
+        import openai
+    except ImportError:
+        print("Error: openai package not installed.")
+        print("Please install it using: pip install openai")
+        sys.exit(1)
+    return httpx, openai
+
+
+@lru_cache(maxsize=1)
+def _import_tiktoken():
+    """Return the tiktoken module, imported on first use."""
+    try:
+        import tiktoken
+    except ImportError:
+        print("Error: tiktoken package not installed.")
+        print("Please install it using: pip install tiktoken")
+        sys.exit(1)
+    return tiktoken
+
+
+@lru_cache(maxsize=1)
+def _import_tenacity():
+    """Return the tenacity module, imported on first use."""
+    try:
+        import tenacity
+    except ImportError:
+        print("Error: tenacity package not installed.")
+        print("Please install it using: pip install tenacity")
+        sys.exit(1)
+    return tenacity
+
+
+@lru_cache(maxsize=1)
+def _import_numpy():
+    """Return numpy for the semantic cache, or None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        print("Warning: numpy package not installed, semantic caching is disabled.")
+        print("Install it using: pip install numpy")
+        return None
+    return numpy
+
+
+def preload_dependencies():
+    """Import every required dependency now, so a long-running server fails at startup."""
+    _import_transcript_api()
+    _import_openai()
+    _import_tiktoken()
+    _import_tenacity()
+
+
+def get_openai_client():
+    """Return the shared OpenAI client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                api_key = os.getenv('OPENAI_API_KEY')
+                if not api_key:
+                    raise RuntimeError("OPENAI_API_KEY not found in environment variables")
+                httpx, openai = _import_openai()
+                timeout = httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT)
+                _openai_client = openai.OpenAI(
+                    api_key=api_key,
+                    timeout=timeout,
+                    max_retries=2,
+                    http_client=httpx.Client(limits=httpx.Limits(**OPENAI_HTTP_LIMITS), timeout=timeout),
+                )
+    return _openai_client
+
+
+def get_async_openai_client():
+    """Return the shared async OpenAI client, creating it on first use."""
+    global _async_openai_client
+    if _async_openai_client is None:
+        with _openai_client_lock:
+            if _async_openai_client is None:
+                api_key = os.getenv('OPENAI_API_KEY')
+                if not api_key:
+                    raise RuntimeError("OPENAI_API_KEY not found in environment variables")
+                httpx, openai = _import_openai()
+                timeout = httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT)
+                _async_openai_client = openai.AsyncOpenAI(
+                    api_key=api_key,
+                    timeout=timeout,
+                    max_retries=2,
+                    http_client=httpx.AsyncClient(limits=httpx.Limits(**OPENAI_HTTP_LIMITS), timeout=timeout),
+                )
+    return _async_openai_client
+
+
+# Transcripts over MAX_INPUT_TOKENS are summarized in CHUNK_TOKENS sections (map)
+# and the section notes combined (reduce), so no single request exceeds the cap
+MAX_INPUT_TOKENS = 60000
+CHUNK_TOKENS = 8000
+OPENAI_MAX_CONCURRENCY = 8
+_openai_semaphore = threading.BoundedSemaphore(OPENAI_MAX_CONCURRENCY)
+
+# Async callers overlap many requests on one event loop; cap them to respect rate limits,
+# and cap the section calls for any one transcript so several videos can progress together
+ASYNC_OPENAI_MAX_CONCURRENCY = 20
+ASYNC_CHUNK_MAX_CONCURRENCY = 10
+_async_openai_semaphore = asyncio.Semaphore(ASYNC_OPENAI_MAX_CONCURRENCY)
+
+# Summaries default to the fast model and escalate to the larger one for detailed
+# summaries or long transcripts, unless the caller names a model explicitly
+DEFAULT_SUMMARY_MODEL = "gpt-4o-mini"
+ESCALATED_SUMMARY_MODEL = "gpt-4o"
+ESCALATE_ABOVE_CHARS = 30000
+SUMMARY_MAX_TOKENS = {"brief": 400, "structured": 1500, "detailed": 1500}
+
+# Hosts extract_video_id accepts, matched exactly so look-alike domains are rejected
+_SHORT_LINK_HOSTS = frozenset({'youtu.be', 'www.youtu.be'})
+_YOUTUBE_HOSTS = frozenset({
+    'youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com',
+    'youtube-nocookie.com', 'www.youtube-nocookie.com',
+})
+
+# Video ID in the path of embed, shorts and legacy /e/ and /v/ player URLs
+_VIDEO_PATH_RE = re.compile(r'/(?:embed|shorts|e|v)/([^/?#&]+)')
+
+# Caption noise removed before summarization in one pass: [Music]-style tags and filler
+# sounds with a trailing comma; sentence-ending punctuation and hyphenated words like
+# "uh-huh" are left alone
+_CAPTION_NOISE_RE = re.compile(r'\[[^\]]*\]|(?<!-)\b(?:um+|uh+|erm|hmm+)\b(?!-),?', re.IGNORECASE)
+
+
+def open_disk_cache(directory=DISK_CACHE_DIR):
+    """Cache transcripts and summaries on disk when no Redis server is configured."""
+    global _disk_cache
+    if _redis is not None or _disk_cache is not None:
+        return
+    try:
+        from diskcache import Cache
+    except ImportError:
+        print("Warning: diskcache package not installed, caching is disabled.")
+        print("Install it using: pip install diskcache")
+        return
+    _disk_cache = Cache(directory)
+
+
+def _compress(text):
+    """Compress a cached string; transcripts and summaries are prose and shrink several-fold."""
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        return zstandard.compress(data, level=3)
+    return zlib.compress(data)
+
+
+def _decompress(blob):
+    """Decompress a value written by _compress in either format."""
+    if blob.startswith(_ZSTD_MAGIC):
+        return zstandard.decompress(blob).decode('utf-8')
+    return zlib.decompress(blob).decode('utf-8')
+
+
+def cache_get(key):
+    """Return a cached string, or None on a miss or when caching is unavailable."""
+    try:
+        if _redis is not None:
+            value = _redis.get(key)
+        elif _disk_cache is not None:
+            value = _disk_cache.get(key)
+        else:
+            return None
+        return _decompress(value) if value is not None else None
+    except Exception:
+        return None
+
+
+def cache_set(key, value, ttl=None):
+    """Store a string in the cache, kept forever when ttl is None; failures are ignored."""
+    try:
+        if _redis is not None:
+            # Every Redis key gets a TTL so volatile-ttl eviction can reclaim memory
+            _redis.setex(key, ttl or SUMMARY_CACHE_TTL, _compress(value))
+        elif _disk_cache is not None:
+            _disk_cache.set(key, _compress(value), expire=ttl)
+    except Exception:
+        pass
+
+
+def summary_cache_key(video_id, summary_style):
+    """Build the cache key for a video's summary in a given style."""
+    return f"sum:{video_id}:{summary_style}"
+
+
+def embed_transcript(transcript_text):
+    """Embed the start of a transcript as a unit vector, or None if unavailable."""
+    np = _import_numpy() if SEMANTIC_CACHE_ENABLED else None
+    if np is None:
+        return None
+    try:
+        response = get_openai_client().embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=transcript_text[:EMBEDDING_INPUT_CHARS]
+        )
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+    except Exception:
+        return None
+
+
+def semantic_cache_lookup(embedding, summary_style):
+    """Return the summary of the most similar cached transcript above the threshold."""
+    np = _import_numpy()
+    with _semantic_lock:
+        entry = _semantic_index.get(summary_style)
+        if entry is None:
+            return None
+        matrix, summaries = entry
+        similarities = matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= SEMANTIC_CACHE_THRESHOLD:
+            return summaries[best]
+    return None
+
+
+def semantic_cache_store(embedding, summary_style, summary):
+    """Add a transcript embedding and its summary, evicting the oldest entry when full."""
+    np = _import_numpy()
+    with _semantic_lock:
+        matrix, summaries = _semantic_index.get(summary_style, (None, []))
+        if matrix is None:
+            matrix = embedding[np.newaxis, :]
+        else:
+            matrix = np.vstack([matrix[-(SEMANTIC_CACHE_SIZE - 1):], embedding])
+        summaries = summaries[-(SEMANTIC_CACHE_SIZE - 1):] + [summary]
+        _semantic_index[summary_style] = (matrix, summaries)
+
+
+def extract_video_id(youtube_url):
+    """
+    Extract video ID from various YouTube URL formats.
+    
+    Supports:
+    - https://www.youtube.com/watch?v=VIDEO_ID
+    - https://youtu.be/VIDEO_ID
+    - https://www.youtube.com/embed/VIDEO_ID
+    - https://www.youtube.com/shorts/VIDEO_ID
+    - https://www.youtube.com/v/VIDEO_ID (and /e/VIDEO_ID)
+    - https://m.youtube.com/watch?v=VIDEO_ID
+    - https://music.youtube.com/watch?v=VIDEO_ID
+    - https://www.youtube-nocookie.com/embed/VIDEO_ID
+    
+    Returns None for any other host and for malformed URLs.
+    """
+    # One urlsplit, then dispatch on host/path; scheme-less input is treated as a URL.
+    # urlsplit raises ValueError on malformed input (e.g. an unclosed IPv6 bracket)
+    url = youtube_url.strip()
+    # Only the part before the query or fragment decides; those may contain URLs of their own
+    if '//' not in url.split('?', 1)[0].split('#', 1)[0]:
+        url = '//' + url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return None
+    host = parts.hostname or ''
+    path = parts.path
+    
+    if host in _SHORT_LINK_HOSTS:
+        return path.lstrip('/').split('/', 1)[0] or None
+    
+    if host in _YOUTUBE_HOSTS:
+        if path == '/watch':
+            return parse_qs(parts.query).get('v', [None])[0]
+        match = _VIDEO_PATH_RE.match(path)
+        if match:
+            return match.group(1)
+    
+    return None
+
+
+def clean_transcript(snippets):
+    """Join caption snippets into text, dropping repeated cues, bracketed tags and filler sounds."""
+    # Auto-captions often repeat a cue back to back; keep one copy of each run
+    cues = (cue for cue, _ in groupby(snippet.text.strip() for snippet in snippets))
+    text = _CAPTION_NOISE_RE.sub(' ', " ".join(cues))
+    # split() with no argument also collapses the gaps the removals leave behind
+    return " ".join(text.split())
+
+
+async def fetch_first_available(transcripts):
+    """Fetch candidate transcripts concurrently and return the first that succeeds."""
+    # Transcript.fetch is a single GET on a signed URL and sets no cookies, so the
+    # candidates can share the lister's session
+    results = await asyncio.gather(
+        *(asyncio.to_thread(with_retries, transcript_obj.fetch) for transcript_obj in transcripts),
+        return_exceptions=True
+    )
+    for transcript_obj, result in zip(transcripts, results):
+        if not isinstance(result, BaseException):
+            return transcript_obj, result
+    return None, None
+
+
+def fetch_best_available(transcripts, language_codes):
+    """Fetch the most suitable transcript: preferred language first, manual before generated."""
+    candidates = sorted(
+        transcripts,
+        key=lambda t: (not t.language_code.startswith(tuple(language_codes)), t.is_generated)
+    )
+    if not candidates:
+        return None, None
+    
+    # The top candidate almost always works, so a single fetch covers the common case
+    try:
+        return candidates[0], with_retries(candidates[0].fetch)
+    except _import_transcript_api().CouldNotRetrieveTranscript:
+        return asyncio.run(fetch_first_available(candidates[1:]))
+
+
+def get_transcript_client():
+    """Return this thread's transcript API client, whose requests reuse pooled connections."""
+    client = getattr(_transcript_clients, 'client', None)
+    if client is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        class TimeoutHTTPAdapter(HTTPAdapter):
+            """HTTPAdapter that applies the transcript timeouts when a request sets none."""
+            
+            def send(self, request, **kwargs):
+                if kwargs.get('timeout') is None:
+                    kwargs['timeout'] = (TRANSCRIPT_CONNECT_TIMEOUT, TRANSCRIPT_READ_TIMEOUT)
+                return super().send(request, **kwargs)
+        
+        session = requests.Session()
+        # Retries happen once, in with_retries, so the adapter itself never retries
+        adapter = TimeoutHTTPAdapter(
+            pool_connections=TRANSCRIPT_HTTP_POOL_SIZE,
+            pool_maxsize=TRANSCRIPT_HTTP_POOL_SIZE,
+            max_retries=0
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        client = _import_transcript_api().YouTubeTranscriptApi(http_client=session)
+        _transcript_clients.client = client
+    return client
+
+
+def with_retries(fn, *args, **kwargs):
+    """Call fn, retrying network errors with exponential backoff."""
+    import requests
+    
+    tenacity = _import_tenacity()
+    retrying = tenacity.Retrying(
+        retry=tenacity.retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
+        stop=tenacity.stop_after_attempt(TRANSCRIPT_FETCH_ATTEMPTS),
+        wait=tenacity.wait_exponential(multiplier=0.5, max=4),
+        reraise=True
+    )
+    return retrying(fn, *args, **kwargs)
+
+
+def get_youtube_transcript(video_id, language_codes=['en']):
+    """Get the transcript of a YouTube video by its ID."""
+    try:
+        ytt_api = get_transcript_client()
+        
+        try:
+            transcript_data = with_retries(ytt_api.fetch, video_id, languages=language_codes)
+        except Exception as e:
+            try:
+                available_transcripts = with_retries(ytt_api.list, video_id)
+                _, transcript_data = fetch_best_available(available_transcripts, language_codes)
+                
+                if not transcript_data:
+                    return None, "No transcripts available for this video"
+            except Exception as e2:
+                error_msg = str(e2)
+                if "YouTube is blocking requests" in error_msg or "IP" in error_msg:
+                    return None, "YouTube is blocking requests from this server. This is common on cloud platforms. Try a different video or run the app locally."
+                return None, f"Error listing transcripts: {error_msg}"
+        
+        # Join the fetched snippets straight into cleaned-up text, no raw dict copy
+        transcript_text = clean_transcript(transcript_data)
+        
+        return transcript_text, None
+        
+    except Exception as e:
+        return None, f"Error fetching transcript: {str(e)}"
+
+
+# Prompts are static; the transcript travels on its own as the user message
+SYSTEM_MESSAGE = "You are an expert content analyst who creates clear, factual summaries of video content. Your summaries are informative, well-organized, and focus on what actually happens in the video. You write in a straightforward, professional tone that clearly explains the content without promotional language. You include specific details and quotes to give readers a complete understanding of what the video covers."
+
+SUMMARY_PROMPTS = {
+    "brief": "Create a concise summary (1-2 paragraphs) of what happens in the video whose transcript is given in the user message. Focus on the main content, who is involved, and what topics are discussed. Write in a straightforward, informative style.",
+    
+    "detailed": "Create a comprehensive summary that covers all important aspects of the content of the video whose transcript is given in the user message. Include specific details about conversations, topics discussed, people involved, and key information shared. Be thorough but factual - focus on what actually happens and what is said rather than promotional language.",
+    
+    "structured": """Create a well-structured summary of the content of the video whose transcript is given in the user message. Organize the information clearly and focus on what actually happens in the video.
+
+Structure your summary with these sections:
+
+**Content Overview**: What type of video this is and who is involved
+**Main Topics Discussed**: The key subjects and conversations that take place
+**Key People**: Who appears in the video and their relevance
+**Important Information**: Specific details, announcements, or notable moments
+**Key Points**: The main takeaways from the content
+
+Write in a clear, factual tone. Focus on summarizing the actual content rather than using promotional language. Be specific about what is discussed and what information is shared.""",
+}
+
+CHUNK_PROMPT = "The user message is one section of a longer video transcript. Summarize it, capturing the topics discussed, the people involved, and any specific details, quotes, or announcements. Do not add an introduction or conclusion - this will be combined with summaries of the other sections."
+
+# System messages are built once per style; each request only adds the transcript message
+_STYLE_MESSAGES = {
+    style: (
+        {"role": "system", "content": SYSTEM_MESSAGE},
+        {"role": "system", "content": prompt}
+    )
+    for style, prompt in SUMMARY_PROMPTS.items()
+}
+_CHUNK_MESSAGE = {"role": "system", "content": CHUNK_PROMPT}
+
+
+def chunk_request(chunk_text, model):
+    """Build the chat request condensing one section of a long transcript into notes."""
+    return dict(
+        model=model,
+        messages=[_CHUNK_MESSAGE, {"role": "user", "content": chunk_text}],
+        max_tokens=500,
+        temperature=0.3
+    )
+
+
+def summarize_chunk(chunk_text, model):
+    """Condense one section of a long transcript into notes for the final summary."""
+    with _openai_semaphore:
+        response = get_openai_client().chat.completions.create(**chunk_request(chunk_text, model))
+    
+    return response.choices[0].message.content.strip()
+
+
+def summarize_chunks(chunks, model):
+    """Summarize transcript sections in parallel and join the notes in order."""
+    with ThreadPoolExecutor(max_workers=OPENAI_MAX_CONCURRENCY) as pool:
+        partial_summaries = list(pool.map(lambda chunk: summarize_chunk(chunk, model), chunks))
+    return "\n\n".join(partial_summaries)
+
+
+async def summarize_chunks_async(chunks, model):
+    """Summarize transcript sections concurrently on the event loop and join the notes in order."""
+    chunk_semaphore = asyncio.Semaphore(ASYNC_CHUNK_MAX_CONCURRENCY)
+    
+    async def summarize_chunk_async(chunk_text):
+        async with chunk_semaphore, _async_openai_semaphore:
+            response = await get_async_openai_client().chat.completions.create(**chunk_request(chunk_text, model))
+        return response.choices[0].message.content.strip()
+    
+    partial_summaries = await asyncio.gather(*(summarize_chunk_async(chunk) for chunk in chunks))
+    return "\n\n".join(partial_summaries)
+
+
+@lru_cache(maxsize=1)
+def get_encoding():
+    """Return the gpt-4o tokenizer, loaded on first use."""
+    return _import_tiktoken().encoding_for_model("gpt-4o")
+
+
+def split_into_chunks(transcript_text):
+    """Return the transcript's CHUNK_TOKENS sections, or None if it fits within MAX_INPUT_TOKENS."""
+    # Every token covers at least one byte, so short transcripts never need the tokenizer
+    if len(transcript_text.encode('utf-8')) <= MAX_INPUT_TOKENS:
+        return None
+    
+    try:
+        encoding = get_encoding()
+    except Exception as e:
+        # tiktoken downloads its BPE file on first load; without it, send the text as-is
+        print(f"Warning: could not load the tokenizer ({e}), sending the transcript unsplit")
+        return None
+    
+    tokens = encoding.encode(transcript_text)
+    if len(tokens) <= MAX_INPUT_TOKENS:
+        return None
+    
+    print(f"Transcript is {len(tokens)} tokens (limit {MAX_INPUT_TOKENS}), summarizing it in sections")
+    return [
+        encoding.decode(tokens[start:start + CHUNK_TOKENS])
+        for start in range(0, len(tokens), CHUNK_TOKENS)
+    ]
+
+
+def fit_to_context(transcript_text, model):
+    """Return text within MAX_INPUT_TOKENS, condensing longer transcripts section by section with model."""
+    chunks = split_into_chunks(transcript_text)
+    if chunks is None:
+        return transcript_text
+    return summarize_chunks(chunks, model)
+
+
+async def fit_to_context_async(transcript_text, model):
+    """Async fit_to_context: sections are condensed concurrently with the async client."""
+    # Tokenizing a long transcript is CPU work, so keep it off the event loop
+    chunks = await asyncio.to_thread(split_into_chunks, transcript_text)
+    if chunks is None:
+        return transcript_text
+    return await summarize_chunks_async(chunks, model)
+
+
+def build_messages(transcript_text, summary_style="structured"):
+    """Build the chat messages asking for a summary in the given style."""
+    return [
+        *_STYLE_MESSAGES.get(summary_style, _STYLE_MESSAGES["structured"]),
+        {"role": "user", "content": transcript_text}
+    ]
+
+
+def summary_model(transcript_text, summary_style="structured", model=None):
+    """Return the model for a summary: the caller's choice, else mini unless the job needs gpt-4o."""
+    if model:
+        return model
+    if summary_style == "detailed" or len(transcript_text) > ESCALATE_ABOVE_CHARS:
+        return ESCALATED_SUMMARY_MODEL
+    return DEFAULT_SUMMARY_MODEL
+
+
+def summary_request(transcript_text, summary_style, model):
+    """Build the chat request for the final summary in the given style."""
+    return dict(
+        model=model,
+        messages=build_messages(transcript_text, summary_style),
+        max_tokens=SUMMARY_MAX_TOKENS.get(summary_style, SUMMARY_MAX_TOKENS["structured"]),
+        temperature=0.3
+    )
+
+
+def summarize_transcript(transcript_text, summary_style="structured", model=None):
+    """Generate a summary using OpenAI, returning (summary, error)."""
+    try:
+        # Near-duplicate transcripts reuse an existing summary instead of a new completion
+        embedding = embed_transcript(transcript_text)
+        if embedding is not None:
+            cached = semantic_cache_lookup(embedding, summary_style)
+            if cached:
+                return cached, None
+        
+        model = summary_model(transcript_text, summary_style, model)
+        
+        # Reduce long transcripts to per-section notes before the final summary
+        transcript_text = fit_to_context(transcript_text, model)
+        
+        with _openai_semaphore:
+            response = get_openai_client().chat.completions.create(
+                **summary_request(transcript_text, summary_style, model)
+            )
+        
+        summary = response.choices[0].message.content.strip()
+        if embedding is not None and summary:
+            semantic_cache_store(embedding, summary_style, summary)
+        
+        return summary, None
+        
+    except Exception as e:
+        return None, f"Error generating summary: {str(e)}"
+
+
+async def prewarm_openai_async():
+    """Open a pooled connection to OpenAI with a cheap request; failures are ignored."""
+    try:
+        await get_async_openai_client().models.list()
+    except Exception:
+        pass
+
+
+async def summarize_transcript_async(transcript_text, summary_style="structured", model=None):
+    """Generate a summary with the async OpenAI client, returning (summary, error)."""
+    try:
+        model = summary_model(transcript_text, summary_style, model)
+        
+        # Reduce long transcripts to per-section notes before the final summary
+        transcript_text = await fit_to_context_async(transcript_text, model)
+        
+        async with _async_openai_semaphore:
+            response = await get_async_openai_client().chat.completions.create(
+                **summary_request(transcript_text, summary_style, model)
+            )
+        
+        return response.choices[0].message.content.strip(), None
+        
+    except Exception as e:
+        return None, f"Error generating summary: {str(e)}"
+
+
+async def stream_summary_async(transcript_text, summary_style="structured", model=None):
+    """Yield the summary in pieces as OpenAI generates it, using the async client."""
+    model = summary_model(transcript_text, summary_style, model)
+    transcript_text = await fit_to_context_async(transcript_text, model)
+    
+    async with _async_openai_semaphore:
+        stream = await get_async_openai_client().chat.completions.create(
+            **summary_request(transcript_text, summary_style, model),
+            stream=True
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+
+def stream_summary(transcript_text, summary_style="structured", model=None):
+    """Yield the summary in pieces as OpenAI generates it."""
+    embedding = embed_transcript(transcript_text)
+    if embedding is not None:
+        cached = semantic_cache_lookup(embedding, summary_style)
+        if cached:
+            yield cached
+            return
+    
+    model = summary_model(transcript_text, summary_style, model)
+    transcript_text = fit_to_context(transcript_text, model)
+    
+    parts = []
+    with _openai_semaphore:
+        stream = get_openai_client().chat.completions.create(
+            **summary_request(transcript_text, summary_style, model),
+            stream=True
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                yield delta
+    
+    summary = "".join(parts).strip()
+    if embedding is not None and summary:
+        semantic_cache_store(embedding, summary_style, summary)